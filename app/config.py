@@ -8,4 +8,19 @@ load_dotenv(BASE_DIR / ".env")
 DATABASE_URL = os.getenv("DATABASE_URL")
 SECRET_KEY = os.getenv("SECRET_KEY")
 ALGORITHM = os.getenv("ALGORITHM")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
\ No newline at end of file
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES"))
+ADMIN_USER_IDS = {int(i) for i in os.getenv("ADMIN_USER_IDS", "").split(",") if i.strip()}
+BACKUP_DIR = Path(os.getenv("BACKUP_DIR", BASE_DIR / "backups"))
+BACKUP_PAGES_PER_STEP = int(os.getenv("BACKUP_PAGES_PER_STEP", "256"))
+BACKUP_STEP_SLEEP = float(os.getenv("BACKUP_STEP_SLEEP", "0.005"))
+
+MAINTENANCE_ENABLED = os.getenv("MAINTENANCE_ENABLED", "true").lower() == "true"
+MAINTENANCE_TICK_SECONDS = float(os.getenv("MAINTENANCE_TICK_SECONDS", "30"))
+MAINTENANCE_SLICE_BUDGET_MS = float(os.getenv("MAINTENANCE_SLICE_BUDGET_MS", "50"))
+MAINTENANCE_BATCH_SIZE = int(os.getenv("MAINTENANCE_BATCH_SIZE", "100"))
+ABANDONED_CART_DAYS = int(os.getenv("ABANDONED_CART_DAYS", "30"))
+ARCHIVE_ABANDONED_CARTS = os.getenv("ARCHIVE_ABANDONED_CARTS", "false").lower() == "true"
+CART_CLEANUP_INTERVAL_SECONDS = float(os.getenv("CART_CLEANUP_INTERVAL_SECONDS", "3600"))
+ANALYZE_INTERVAL_SECONDS = float(os.getenv("ANALYZE_INTERVAL_SECONDS", "21600"))
+VACUUM_INTERVAL_SECONDS = float(os.getenv("VACUUM_INTERVAL_SECONDS", "3600"))
+VACUUM_PAGES_PER_STEP = int(os.getenv("VACUUM_PAGES_PER_STEP", "64"))
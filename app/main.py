@@ -1,6 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from app.config import MAINTENANCE_ENABLED
 from app.database import Base, engine
-from app.routes import auth, cart, users, products, categories, cart_items
+from app.routes import auth, cart, users, products, categories, cart_items, backup, maintenance
+from app.utils.maintenance import add_cart_timestamps, scheduler
 import logging
 
 logging.basicConfig(
@@ -12,9 +15,18 @@ logging.basicConfig(
 )
 
 Base.metadata.create_all(bind=engine)
+add_cart_timestamps()
 
 logger = logging.getLogger(__name__)
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if MAINTENANCE_ENABLED:
+        scheduler.start()
+    yield
+    await scheduler.stop()
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(auth.router)
 app.include_router(users.router)
@@ -22,7 +34,9 @@ app.include_router(products.router)
 app.include_router(categories.router)
 app.include_router(cart.router)
 app.include_router(cart_items.router)
+app.include_router(backup.router)
+app.include_router(maintenance.router)
 
 @app.get("/")
 def root():
-    return {"message": "Hello, World!"}
\ No newline at end of file
+    return {"message": "Hello, World!"}
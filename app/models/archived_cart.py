@@ -0,0 +1,13 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, Text
+from app.database import Base
+
+class ArchivedCart(Base):
+    __tablename__ = "archived_carts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    cart_id = Column(Integer, index=True)
+    user_id = Column(Integer, index=True)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+    items = Column(Text)
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, ForeignKey
+from datetime import datetime
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -7,5 +8,6 @@ class Cart(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
 
     items = relationship("CartItem", back_populates="cart", cascade="all, delete-orphan")
@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from app.utils.dependencies import get_admin_user
+from app.utils.backup import (
+    backup_status,
+    default_backup_path,
+    release_backup,
+    reserve_backup,
+    run_backup,
+)
+from app.schemas.backup import BackupStartResponse, BackupStatusResponse
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/admin/backup", tags=["Admin"], dependencies=[Depends(get_admin_user)])
+
+def run_backup_task(dest_path, compress: bool, verify: bool):
+    try:
+        run_backup(dest_path=dest_path, compress=compress, verify=verify, reserved=True)
+    except Exception:
+        # run_backup has already logged the failure and recorded it in the status
+        pass
+
+@router.post("/", response_model=BackupStartResponse, status_code=202)
+def start_backup(
+    current_user_id: int = Depends(get_admin_user),
+    compress: bool = Query(False, description="Write a gzip-compressed snapshot"),
+    verify: bool = Query(True, description="Run an integrity check on the snapshot"),
+):
+    # Reserve the backup slot before answering so concurrent requests cannot
+    # both be promised a snapshot; the worker thread releases it when done.
+    if not reserve_backup():
+        logger.warning(f"User {current_user_id} requested a backup while one is already running")
+        raise HTTPException(status_code=409, detail="A backup is already running")
+
+    try:
+        dest_path = default_backup_path(compress)
+        threading.Thread(target=run_backup_task, args=(dest_path, compress, verify), name="backup").start()
+    except Exception:
+        release_backup()
+        raise
+    logger.info(f"Backup to {dest_path} scheduled by user {current_user_id}")
+
+    return {"message": "Backup started", "path": str(dest_path)}
+
+@router.get("/status", response_model=BackupStatusResponse)
+def get_backup_status():
+    return backup_status
@@ -1,5 +1,7 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
 from app.database import SessionLocal
 from app.models.cart import Cart
 from app.models.cart_item import CartItem
@@ -42,7 +44,14 @@ def create_cart_item(
         quantity=cart_item.quantity
     )
     db.add(new_cart_item)
-    db.commit()
+    cart.updated_at = datetime.utcnow()
+    try:
+        db.commit()
+    except StaleDataError:
+        # The maintenance job purged the cart after it was loaded above
+        db.rollback()
+        logger.warning(f"Cart {cart_id} was purged while adding product {cart_item.product_id}")
+        raise HTTPException(status_code=404, detail="Cart not found or does not belong to user")
     db.refresh(new_cart_item)
     logger.info(f"Cart item created - ID: {new_cart_item.id}, Product: {cart_item.product_id}, Quantity: {cart_item.quantity}, Cart: {cart_id}")
 
@@ -73,10 +82,17 @@ def update_cart_item(
 
     if update_data.quantity is not None and update_data.quantity != cart_item.quantity:
         cart_item.quantity = update_data.quantity
+        cart_item.cart.updated_at = datetime.utcnow()
         updated = True
 
     if updated:
-        db.commit()
+        try:
+            db.commit()
+        except StaleDataError:
+            # The maintenance job purged the cart after it was loaded above
+            db.rollback()
+            logger.warning(f"Cart item {cart_item_id} was purged with its cart before the update was saved")
+            raise HTTPException(status_code=404, detail="Cart item not found")
         db.refresh(cart_item)
         logger.info(f"Cart item {cart_item_id} updated: quantity {old_quantity} -> {cart_item.quantity}")    
         
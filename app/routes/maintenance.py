@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from app.utils.dependencies import get_admin_user
+from app.utils.maintenance import scheduler
+from app.schemas.maintenance import MaintenanceStatusResponse
+import logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/api/admin/maintenance", tags=["Admin"], dependencies=[Depends(get_admin_user)])
+
+@router.get("/", response_model=MaintenanceStatusResponse)
+def get_maintenance_status():
+    return {
+        "running": scheduler.running,
+        "tick_seconds": scheduler.tick,
+        "budget_ms": scheduler.budget_ms,
+        "jobs": [job.summary() for job in scheduler.jobs],
+        "history": list(reversed(scheduler.history)),
+    }
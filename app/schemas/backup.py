@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class BackupStartResponse(BaseModel):
+    message: str
+    path: str
+
+class BackupStatusResponse(BaseModel):
+    state: str
+    path: Optional[str] = None
+    total_pages: int
+    remaining_pages: int
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
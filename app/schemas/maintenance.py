@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class MaintenanceJobResponse(BaseModel):
+    name: str
+    interval_seconds: float
+    runs: int
+    failures: int
+    avg_ms: float
+    max_ms: float
+    last_run_at: Optional[str] = None
+    last_result: Optional[dict] = None
+    last_error: Optional[str] = None
+
+class MaintenanceRunResponse(BaseModel):
+    job: str
+    started_at: str
+    duration_ms: float
+    result: Optional[dict] = None
+    error: Optional[str] = None
+
+class MaintenanceStatusResponse(BaseModel):
+    running: bool
+    tick_seconds: float
+    budget_ms: float
+    jobs: List[MaintenanceJobResponse]
+    history: List[MaintenanceRunResponse]
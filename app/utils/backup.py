@@ -0,0 +1,222 @@
+import gzip
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy.engine import make_url
+from app.config import DATABASE_URL, BACKUP_DIR, BACKUP_PAGES_PER_STEP, BACKUP_STEP_SLEEP
+
+logger = logging.getLogger(__name__)
+
+_backup_lock = threading.Lock()
+
+backup_status = {
+    "state": "idle",
+    "path": None,
+    "total_pages": 0,
+    "remaining_pages": 0,
+    "started_at": None,
+    "finished_at": None,
+    "error": None,
+}
+
+
+class BackupInProgressError(Exception):
+    pass
+
+
+class BackupVerificationError(Exception):
+    pass
+
+
+def get_database_path():
+    return make_url(DATABASE_URL).database
+
+
+def default_backup_path(compress: bool = False):
+    timestamp = datetime.utcnow().strftime("%Y%m%d-%H%M%S-%f")
+    suffix = ".db.gz" if compress else ".db"
+    return BACKUP_DIR / f"app-{timestamp}{suffix}"
+
+
+def is_backup_running():
+    return _backup_lock.locked()
+
+
+def reserve_backup():
+    """Claim the backup slot without blocking; pass reserved=True to run_backup afterwards."""
+    return _backup_lock.acquire(blocking=False)
+
+
+def release_backup():
+    _backup_lock.release()
+
+
+def _copy_pages(source, dest, pages, step_sleep, progress):
+    def on_progress(status, remaining, total):
+        backup_status["total_pages"] = total
+        backup_status["remaining_pages"] = remaining
+        if progress:
+            progress(remaining, total)
+
+        # The source only holds a WAL read snapshot, so writers are never blocked;
+        # sleeping between steps just spreads the copy's I/O out over time.
+        if remaining and step_sleep:
+            time.sleep(step_sleep)
+
+    source.backup(dest, pages=pages, progress=on_progress)
+
+
+def _integrity_check(connection):
+    result = connection.execute("PRAGMA integrity_check").fetchall()
+    return [row[0] for row in result]
+
+
+def _compress_file(source_path: Path, dest_path: Path):
+    with open(source_path, "rb") as src, gzip.open(dest_path, "wb") as dst:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+
+def _sha256(path: Path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def run_backup(
+    dest_path=None,
+    source_path=None,
+    compress: bool = False,
+    verify: bool = True,
+    pages: int = BACKUP_PAGES_PER_STEP,
+    step_sleep: float = BACKUP_STEP_SLEEP,
+    progress=None,
+    reserved: bool = False,
+):
+    """Copy the live database into a standalone snapshot file.
+
+    Pages are copied in batches of `pages`, pausing `step_sleep` seconds between
+    batches. `progress` is called with (remaining_pages, total_pages) after each
+    batch. Set `reserved` when the caller already holds the slot from
+    reserve_backup(); it is released once the backup finishes either way.
+    Returns a summary dict describing the written snapshot.
+    """
+    if not reserved and not reserve_backup():
+        raise BackupInProgressError("A backup is already running")
+
+    try:
+        return _run_backup(dest_path, source_path, compress, verify, pages, step_sleep, progress)
+    finally:
+        release_backup()
+
+
+def _run_backup(dest_path, source_path, compress, verify, pages, step_sleep, progress):
+    started = time.perf_counter()
+    backup_status.update({
+        "state": "running",
+        "path": None,
+        "total_pages": 0,
+        "remaining_pages": 0,
+        "started_at": datetime.utcnow().isoformat(),
+        "finished_at": None,
+        "error": None,
+    })
+
+    try:
+        source_path = source_path or get_database_path()
+        if not source_path or source_path == ":memory:":
+            raise ValueError("DATABASE_URL does not point to a database file")
+        source_path = Path(source_path)
+        dest_path = Path(dest_path or default_backup_path(compress))
+    except Exception as e:
+        backup_status.update({"state": "failed", "finished_at": datetime.utcnow().isoformat(), "error": str(e)})
+        logger.error(f"Backup failed - error: {e}")
+        raise
+
+    snapshot_path = dest_path.with_name(dest_path.name + ".tmp")
+    backup_status["path"] = str(dest_path)
+    logger.info(f"Backup started - source: {source_path}, destination: {dest_path}")
+
+    try:
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        if snapshot_path.exists():
+            snapshot_path.unlink()
+
+        source = sqlite3.connect(source_path, isolation_level=None)
+        dest = sqlite3.connect(snapshot_path)
+        try:
+            # Without an open read transaction on the source, every commit from
+            # another connection restarts the backup from page one. Pinning a WAL
+            # read snapshot lets SQLite reuse it across steps, so the copy stays
+            # incremental and consistent while writers keep committing.
+            source.execute("BEGIN")
+            source.execute("SELECT count(*) FROM sqlite_master").fetchone()
+            _copy_pages(source, dest, pages, step_sleep, progress)
+
+            # The copied header keeps the source's WAL flag; switch the snapshot
+            # back to a rollback journal so it is a single self-contained file.
+            dest.execute("PRAGMA journal_mode=DELETE")
+
+            if verify:
+                problems = _integrity_check(dest)
+                if problems != ["ok"]:
+                    raise BackupVerificationError(f"Snapshot failed integrity check: {problems[:5]}")
+        finally:
+            dest.close()
+            source.close()
+
+        if compress:
+            compressed_path = dest_path.with_name(dest_path.name + ".part")
+            _compress_file(snapshot_path, compressed_path)
+            snapshot_path.unlink()
+            os.replace(compressed_path, dest_path)
+        else:
+            os.replace(snapshot_path, dest_path)
+
+        summary = {
+            "path": str(dest_path),
+            "pages": backup_status["total_pages"],
+            "size_bytes": dest_path.stat().st_size,
+            "sha256": _sha256(dest_path),
+            "compressed": compress,
+            "verified": verify,
+            "duration_seconds": round(time.perf_counter() - started, 3),
+        }
+        backup_status.update({"state": "completed", "finished_at": datetime.utcnow().isoformat()})
+        logger.info(f"Backup completed - path: {dest_path}, pages: {summary['pages']}, duration: {summary['duration_seconds']}s")
+
+        return summary
+    except Exception as e:
+        for leftover in (snapshot_path, dest_path.with_name(dest_path.name + ".part")):
+            if leftover.exists():
+                leftover.unlink()
+        backup_status.update({"state": "failed", "finished_at": datetime.utcnow().isoformat(), "error": str(e)})
+        logger.error(f"Backup failed - destination: {dest_path}, error: {e}")
+        raise
+
+
+def verify_backup(path):
+    """Run an integrity check against a snapshot, decompressing it first if gzipped."""
+    path = Path(path)
+    if path.suffix != ".gz":
+        connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            return _integrity_check(connection) == ["ok"]
+        finally:
+            connection.close()
+
+    restored_path = path.with_name(path.stem + ".verify")
+    try:
+        with gzip.open(path, "rb") as src, open(restored_path, "wb") as dst:
+            shutil.copyfileobj(src, dst, length=1024 * 1024)
+        return verify_backup(restored_path)
+    finally:
+        if restored_path.exists():
+            restored_path.unlink()
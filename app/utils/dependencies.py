@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, Request
 from jose import jwt, JWTError
-from app.config import SECRET_KEY, ALGORITHM
+from app.config import SECRET_KEY, ALGORITHM, ADMIN_USER_IDS
 
 def get_current_user(request: Request):
     token = request.cookies.get("access_token")
@@ -13,3 +13,8 @@ def get_current_user(request: Request):
         return int(payload["sub"])
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid token")
+
+def get_admin_user(current_user_id: int = Depends(get_current_user)):
+    if current_user_id not in ADMIN_USER_IDS:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return current_user_id
@@ -0,0 +1,258 @@
+import asyncio
+import json
+import logging
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select
+from app.config import (
+    ABANDONED_CART_DAYS,
+    ANALYZE_INTERVAL_SECONDS,
+    ARCHIVE_ABANDONED_CARTS,
+    CART_CLEANUP_INTERVAL_SECONDS,
+    MAINTENANCE_BATCH_SIZE,
+    MAINTENANCE_SLICE_BUDGET_MS,
+    MAINTENANCE_TICK_SECONDS,
+    VACUUM_INTERVAL_SECONDS,
+    VACUUM_PAGES_PER_STEP,
+)
+from app.database import SessionLocal, engine
+from app.models.archived_cart import ArchivedCart
+from app.models.cart import Cart
+from app.models.cart_item import CartItem
+
+logger = logging.getLogger(__name__)
+
+HISTORY_SIZE = 50
+
+
+def add_cart_timestamps():
+    """Add carts.updated_at to databases created before the column existed."""
+    with engine.begin() as conn:
+        columns = [row[1] for row in conn.exec_driver_sql("PRAGMA table_info(carts)")]
+        if "updated_at" in columns:
+            return
+        conn.exec_driver_sql("ALTER TABLE carts ADD COLUMN updated_at DATETIME")
+        conn.exec_driver_sql("UPDATE carts SET updated_at = CURRENT_TIMESTAMP")
+        conn.exec_driver_sql("CREATE INDEX IF NOT EXISTS ix_carts_updated_at ON carts (updated_at)")
+    logger.info("Added updated_at column to carts table")
+
+
+def purge_abandoned_carts(deadline: float):
+    cutoff = datetime.utcnow() - timedelta(days=ABANDONED_CART_DAYS)
+    removed = 0
+    pending = True
+
+    # Each batch is its own short transaction so the write lock is released
+    # between batches and foreground requests can get in.
+    while pending and time.perf_counter() < deadline:
+        db = SessionLocal()
+        try:
+            stale_ids = (
+                select(Cart.id)
+                .where(Cart.updated_at < cutoff)
+                .order_by(Cart.updated_at)
+                .limit(MAINTENANCE_BATCH_SIZE)
+            )
+            # Picking and deleting the batch in one statement means a cart touched
+            # after it went stale is never removed. The statement also takes the
+            # write lock, held until commit, so no item can be added to these
+            # carts while they are archived and their items deleted.
+            carts = db.execute(
+                delete(Cart)
+                .where(Cart.id.in_(stale_ids))
+                .returning(Cart.id, Cart.user_id, Cart.updated_at)
+                .execution_options(synchronize_session=False)
+            ).all()
+            cart_ids = [cart.id for cart in carts]
+            if cart_ids:
+                if ARCHIVE_ABANDONED_CARTS:
+                    items_by_cart = defaultdict(list)
+                    for item in db.query(CartItem).filter(CartItem.cart_id.in_(cart_ids)):
+                        items_by_cart[item.cart_id].append({"product_id": item.product_id, "quantity": item.quantity})
+                    db.add_all([
+                        ArchivedCart(
+                            cart_id=cart.id,
+                            user_id=cart.user_id,
+                            updated_at=cart.updated_at,
+                            items=json.dumps(items_by_cart[cart.id]),
+                        )
+                        for cart in carts
+                    ])
+                db.query(CartItem).filter(CartItem.cart_id.in_(cart_ids)).delete(synchronize_session=False)
+            db.commit()
+            removed += len(cart_ids)
+            pending = len(cart_ids) == MAINTENANCE_BATCH_SIZE
+        finally:
+            db.close()
+
+    if removed:
+        action = "archived" if ARCHIVE_ABANDONED_CARTS else "purged"
+        logger.info(f"{removed} carts untouched since {cutoff.isoformat()} {action}")
+
+    return {"carts_removed": removed, "archived": ARCHIVE_ABANDONED_CARTS, "pending": pending}
+
+
+def refresh_statistics(deadline: float):
+    with engine.begin() as conn:
+        # Bound the rows ANALYZE samples per index so a run stays short on large tables.
+        conn.exec_driver_sql("PRAGMA analysis_limit=400")
+        has_stats = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+        ).first()
+        if has_stats:
+            conn.exec_driver_sql("PRAGMA optimize")
+            action = "optimize"
+        else:
+            conn.exec_driver_sql("ANALYZE")
+            action = "analyze"
+
+    return {"action": action, "pending": False}
+
+
+def reclaim_free_pages(deadline: float):
+    with engine.connect() as conn:
+        auto_vacuum = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+    if auto_vacuum != 2:
+        # Switching an existing database to incremental mode needs a full VACUUM,
+        # which locks the whole file; leave that to an operator.
+        return {"skipped": "auto_vacuum is not INCREMENTAL", "pages_reclaimed": 0, "pending": False}
+
+    reclaimed = 0
+    free_pages = None
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        while time.perf_counter() < deadline:
+            free_pages = cursor.execute("PRAGMA freelist_count").fetchone()[0]
+            if not free_pages:
+                break
+            # A plain execute() only steps the pragma once, freeing a single page;
+            # executescript() runs it to completion.
+            connection.driver_connection.executescript(f"PRAGMA incremental_vacuum({VACUUM_PAGES_PER_STEP});")
+            step = min(free_pages, VACUUM_PAGES_PER_STEP)
+            reclaimed += step
+            free_pages -= step
+        cursor.close()
+    finally:
+        connection.close()
+
+    if reclaimed:
+        logger.info(f"Incremental vacuum reclaimed {reclaimed} pages")
+
+    return {"pages_reclaimed": reclaimed, "pending": bool(free_pages)}
+
+
+class MaintenanceJob:
+    def __init__(self, name: str, interval: float, func):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self.next_run = time.monotonic()
+        self.runs = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_run_at = None
+        self.last_result = None
+        self.last_error = None
+
+    def summary(self):
+        return {
+            "name": self.name,
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "avg_ms": round(self.total_ms / self.runs, 3) if self.runs else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "last_run_at": self.last_run_at,
+            "last_result": self.last_result,
+            "last_error": self.last_error,
+        }
+
+
+class MaintenanceScheduler:
+    """Runs maintenance jobs in small time-bounded slices on a background task.
+
+    Every tick at most one slice of each due job runs in a worker thread with a
+    deadline of `budget_ms`. A job that reports pending work is picked up again
+    on the next tick instead of waiting for its full interval.
+    """
+
+    def __init__(self, tick: float = MAINTENANCE_TICK_SECONDS, budget_ms: float = MAINTENANCE_SLICE_BUDGET_MS):
+        self.tick = tick
+        self.budget_ms = budget_ms
+        self.jobs = []
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self._task = None
+
+    def add_job(self, name: str, interval: float, func):
+        self.jobs.append(MaintenanceJob(name, interval, func))
+
+    @property
+    def running(self):
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Maintenance scheduler started with jobs: {', '.join(job.name for job in self.jobs)}")
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Maintenance scheduler stopped")
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.tick)
+            for job in self.jobs:
+                if time.monotonic() >= job.next_run:
+                    await self.run_slice(job)
+
+    async def run_slice(self, job: MaintenanceJob):
+        started_at = datetime.utcnow().isoformat()
+        start = time.perf_counter()
+        deadline = start + self.budget_ms / 1000
+        result = None
+        error = None
+
+        try:
+            result = await asyncio.to_thread(job.func, deadline)
+        except Exception as e:
+            error = str(e)
+            job.failures += 1
+            logger.error(f"Maintenance job {job.name} failed: {e}")
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms > self.budget_ms * 2:
+            logger.warning(f"Maintenance job {job.name} took {duration_ms:.1f}ms, over its {self.budget_ms}ms budget")
+
+        job.runs += 1
+        job.total_ms += duration_ms
+        job.max_ms = max(job.max_ms, duration_ms)
+        job.last_run_at = started_at
+        job.last_result = result
+        job.last_error = error
+        pending = bool(result and result.get("pending"))
+        job.next_run = time.monotonic() + (0 if pending else job.interval)
+
+        self.history.append({
+            "job": job.name,
+            "started_at": started_at,
+            "duration_ms": round(duration_ms, 3),
+            "result": result,
+            "error": error,
+        })
+
+
+scheduler = MaintenanceScheduler()
+scheduler.add_job("abandoned_carts", CART_CLEANUP_INTERVAL_SECONDS, purge_abandoned_carts)
+scheduler.add_job("analyze", ANALYZE_INTERVAL_SECONDS, refresh_statistics)
+scheduler.add_job("incremental_vacuum", VACUUM_INTERVAL_SECONDS, reclaim_free_pages)
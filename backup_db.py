@@ -0,0 +1,52 @@
+import argparse
+import os
+import sqlite3
+import sys
+from app.config import BACKUP_PAGES_PER_STEP, BACKUP_STEP_SLEEP
+from app.utils.backup import BackupInProgressError, BackupVerificationError, run_backup, verify_backup
+
+parser = argparse.ArgumentParser(description="Take an online backup of the application database.")
+parser.add_argument("output", nargs="?", help="Snapshot path (defaults to BACKUP_DIR/app-<timestamp>.db)")
+parser.add_argument("--compress", action="store_true", help="Write a gzip-compressed snapshot")
+parser.add_argument("--no-verify", action="store_true", help="Skip the integrity check of the snapshot")
+parser.add_argument("--pages", type=int, default=BACKUP_PAGES_PER_STEP, help="Pages copied per step")
+parser.add_argument("--sleep", type=float, default=BACKUP_STEP_SLEEP, help="Seconds to pause between steps")
+parser.add_argument("--verify-only", metavar="SNAPSHOT", help="Only run an integrity check on an existing snapshot")
+args = parser.parse_args()
+
+if args.verify_only:
+    if not os.path.isfile(args.verify_only):
+        print(f"{args.verify_only}: not found")
+        sys.exit(1)
+    try:
+        ok = verify_backup(args.verify_only)
+    except (sqlite3.DatabaseError, OSError, EOFError) as e:
+        print(f"{args.verify_only}: integrity check failed ({e})")
+        sys.exit(1)
+    if ok:
+        print(f"{args.verify_only}: ok")
+        sys.exit(0)
+    print(f"{args.verify_only}: integrity check failed")
+    sys.exit(1)
+
+def print_progress(remaining, total):
+    done = total - remaining
+    percent = 100 * done / total if total else 100
+    print(f"\rCopied {done}/{total} pages ({percent:.1f}%)", end="", flush=True)
+
+try:
+    summary = run_backup(
+        dest_path=args.output,
+        compress=args.compress,
+        verify=not args.no_verify,
+        pages=args.pages,
+        step_sleep=args.sleep,
+        progress=print_progress,
+    )
+except (BackupInProgressError, BackupVerificationError, ValueError) as e:
+    print(f"\nBackup failed: {e}")
+    sys.exit(1)
+
+print("\n")
+for key, value in summary.items():
+    print(f"{key}: {value}")
@@ -0,0 +1,94 @@
+import argparse
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from app.utils.backup import run_backup
+
+parser = argparse.ArgumentParser(description="Measure write latency while an online backup is running.")
+parser.add_argument("--rows", type=int, default=500_000, help="Rows in the generated cart_items table")
+parser.add_argument("--pages", type=int, default=256, help="Pages copied per backup step")
+parser.add_argument("--sleep", type=float, default=0.005, help="Seconds to pause between backup steps")
+parser.add_argument("--seconds", type=float, default=10.0, help="Minimum time to sample writes, with and without backups")
+args = parser.parse_args()
+
+def build_database(path, rows):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE carts (id INTEGER PRIMARY KEY, user_id INTEGER)")
+    conn.execute(
+        "CREATE TABLE cart_items (id INTEGER PRIMARY KEY, cart_id INTEGER, product_id INTEGER, quantity INTEGER, note TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO cart_items (cart_id, product_id, quantity, note) VALUES (?, ?, ?, ?)",
+        ((i % 10_000, i % 500, 1, "x" * 200) for i in range(rows)),
+    )
+    conn.commit()
+    conn.close()
+
+def percentile(samples, p):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p))]
+
+def sample_writes(path, stop, samples):
+    conn = sqlite3.connect(path, timeout=30)
+    conn.execute("PRAGMA busy_timeout=30000")
+    while not stop.is_set():
+        start = time.perf_counter()
+        conn.execute("INSERT INTO carts (user_id) VALUES (1)")
+        conn.commit()
+        samples.append((time.perf_counter() - start) * 1000)
+        time.sleep(0.001)
+    conn.close()
+
+def report(label, samples):
+    print(
+        f"{label:<16} writes={len(samples):>6}  "
+        f"p50={percentile(samples, 0.50):7.3f}ms  p99={percentile(samples, 0.99):7.3f}ms  max={max(samples):7.3f}ms"
+    )
+
+with tempfile.TemporaryDirectory() as tmp:
+    db_path = os.path.join(tmp, "bench.db")
+    build_database(db_path, args.rows)
+    print(f"Database size: {os.path.getsize(db_path) / 1024 / 1024:.1f} MiB")
+
+    stop = threading.Event()
+    baseline = []
+    writer = threading.Thread(target=sample_writes, args=(db_path, stop, baseline))
+    writer.start()
+    time.sleep(args.seconds)
+    stop.set()
+    writer.join()
+
+    stop = threading.Event()
+    during_backup = []
+    writer = threading.Thread(target=sample_writes, args=(db_path, stop, during_backup))
+    writer.start()
+    # Keep backing up until the writer has been sampled for long enough that
+    # p99 is not just one of a handful of slow writes.
+    durations = []
+    steps = []
+    deadline = time.perf_counter() + args.seconds
+    while time.perf_counter() < deadline:
+        progress = []
+        summary = run_backup(
+            dest_path=os.path.join(tmp, "snapshot.db"),
+            source_path=db_path,
+            pages=args.pages,
+            step_sleep=args.sleep,
+            progress=lambda remaining, total: progress.append(remaining),
+        )
+        if any(later >= earlier for earlier, later in zip(progress, progress[1:])):
+            print("warning: backup restarted instead of stepping through a single snapshot")
+        durations.append(summary["duration_seconds"])
+        steps.append(len(progress))
+    stop.set()
+    writer.join()
+
+    print(
+        f"{len(durations)} backups, {min(steps)}-{max(steps)} steps each, "
+        f"{min(durations):.2f}-{max(durations):.2f}s per backup"
+    )
+    report("no backup", baseline)
+    report("during backup", during_backup)